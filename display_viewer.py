@@ -7,12 +7,38 @@ Feed monitoring is handled separately by feed_monitor.py.
 
 import sys
 import asyncio
+import bisect
+import hashlib
+import itertools
 import json
+import math
 import time
 import random
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
-from playwright.async_api import async_playwright, Page
+from types import SimpleNamespace
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+try:
+    import numpy as np  # Optional vectorized post weighting
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # Optional JIT for the fused weight + pick loop
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # Optional faster JSON parser
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # Optional faster hash for queue change detection
+except ImportError:
+    xxhash = None
 
 # Force unbuffered output
 sys.stdout.reconfigure(line_buffering=True)
@@ -24,16 +50,193 @@ from config import (
     MAX_TIME_PER_POST,
     QUEUE_FILE,
     QUEUE_CHECK_INTERVAL,
-    WINDOW_WIDTH,
-    WINDOW_HEIGHT,
-    WINDOW_POSITION_X,
-    WINDOW_POSITION_Y,
     PAGE_LOAD_TIMEOUT,
     PAGE_SETTLE_TIME,
-    BROWSER_TYPE,
 )
+from launcher import launch_browser
 
 ZOOM_LEVEL = 0.67  # 67% zoom (zoom out)
+# Recency weight for each day (index 0 = today, 1 = yesterday, etc.)
+RECENCY_WEIGHTS = (
+    1.0, 0.91, 0.4, 0.32,  # Days 0-3
+    0.25, 0.25, 0.25, 0.25,  # Days 4-7
+    0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15,  # Days 8-14
+    0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08,  # Days 15-22
+    0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08,  # Days 23-30
+)
+DEFAULT_RECENCY_WEIGHT = 0.03  # For days > 30
+UNKNOWN_DATE_RECENCY_WEIGHT = 0.1  # Default low weight if date parsing failed
+
+# The table as an array for vectorized lookup, with the default as an extra
+# last entry that out-of-range ages are mapped to
+RECENCY_WEIGHTS_ARRAY = np.array(RECENCY_WEIGHTS + (DEFAULT_RECENCY_WEIGHT,)) if np is not None else None
+
+# Calls into the window.__inkhaven helpers set up by OVERLAY_JS, kept to
+# one-liners so each page.evaluate sends almost nothing
+STOP_SCROLL_JS = "() => window.__inkhaven && window.__inkhaven.stop()"
+
+# Skip button and scroll loop, registered with add_init_script so they are
+# set up on every page load, along with the zoom level. Called with
+# {speed, interval, settleMs, zoom}.
+# The loop wakes once per SCROLL_INTERVAL, scrolls on the next animation
+# frame by whole pixels at SCROLL_SPEED pixels per SCROLL_INTERVAL, and
+# returns to the top when it reaches the bottom. It stops when
+# window.__inkhaven.stop() is called.
+OVERLAY_JS = """
+({ speed, interval, settleMs, zoom }) => {
+    // Only the top-level document gets the overlay, not iframes
+    if (window.top !== window) return;
+
+    // Page-side state and helpers, called from Python through page.evaluate
+    const inkhaven = window.__inkhaven = {
+        scrolling: false,
+        stopped: false,
+        stop: () => { inkhaven.stopped = true; },
+    };
+
+    const install = () => {
+        document.body.style.zoom = zoom;
+
+        // Remove any existing skip button
+        const existing = document.getElementById('inkhaven-skip-btn');
+        if (existing) existing.remove();
+
+        // Create skip button
+        const btn = document.createElement('button');
+        btn.id = 'inkhaven-skip-btn';
+        btn.innerHTML = '⏭';
+        btn.style.cssText = `
+            position: fixed;
+            top: 30px;
+            right: 30px;
+            z-index: 999999;
+            padding: 12px 16px;
+            font-size: 20px;
+            background: rgba(255, 255, 255, 0.85);
+            color: #64748b;
+            border: 1px solid rgba(226, 232, 240, 0.8);
+            border-radius: 50px;
+            cursor: pointer;
+            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
+            backdrop-filter: blur(8px);
+            transition: all 0.25s ease;
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+            opacity: 0.6;
+        `;
+
+        btn.onmouseover = () => {
+            btn.style.opacity = '1';
+            btn.style.transform = 'translateY(-2px)';
+            btn.style.boxShadow = '0 4px 12px rgba(0, 0, 0, 0.15)';
+            btn.style.background = 'rgba(255, 255, 255, 0.95)';
+            btn.style.color = '#475569';
+        };
+        btn.onmouseout = () => {
+            btn.style.opacity = '0.6';
+            btn.style.transform = 'translateY(0)';
+            btn.style.boxShadow = '0 2px 8px rgba(0, 0, 0, 0.1)';
+            btn.style.background = 'rgba(255, 255, 255, 0.85)';
+            btn.style.color = '#64748b';
+        };
+
+        btn.onclick = () => {
+            // Calls straight into Python (see DisplayViewer.run_in_browser)
+            if (window.inkhavenSkip) window.inkhavenSkip();
+            btn.innerHTML = '✓';
+            btn.style.background = 'rgba(16, 185, 129, 0.9)';
+            btn.style.color = 'white';
+            btn.style.opacity = '1';
+        };
+
+        document.body.appendChild(btn);
+
+        // Scroll loop driven by the browser's frame clock, started once the page has settled
+        if (inkhaven.scrolling) return;
+        inkhaven.scrolling = true;
+        inkhaven.stopped = false;
+        let last = 0;
+        let pending = 0;  // Fractional pixels not yet scrolled
+        const step = (now) => {
+            if (inkhaven.stopped) return;
+            pending += speed * (now - last) / (interval * 1000);
+            last = now;
+            const px = Math.floor(pending);
+            if (px > 0) {
+                window.scrollBy(0, px);
+                pending -= px;
+            }
+            if ((window.innerHeight + window.scrollY) >= document.body.scrollHeight - 100) {
+                // Scroll back to top and pause briefly, the pause doesn't count as scroll time
+                window.scrollTo(0, 0);
+                pending = 0;
+                setTimeout(() => requestAnimationFrame((t) => { last = t; step(t); }), 500);
+                return;
+            }
+            // Sleep until the next scroll step is due instead of waking every frame
+            setTimeout(() => requestAnimationFrame(step), interval * 1000);
+        };
+        setTimeout(() => {
+            last = performance.now();
+            requestAnimationFrame(step);
+        }, settleMs);
+    };
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', install);
+    } else {
+        install();
+    }
+}
+"""
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_timestamp(date_str):
+    """
+    Parse an ISO 8601 date string into a Unix timestamp, or NaN on failure.
+    Cached, so unchanged posts aren't reparsed on every queue reload.
+    """
+    try:
+        post_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return math.nan
+    return post_date.timestamp()  # Naive dates are taken as local time
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _fused_weight(recency, last_shown, now_ts):
+        """One post's weight, same formula as DisplayViewer.calculate_weight"""
+        if last_shown > 0:
+            time_weight = min((now_ts - last_shown) / 3600.0, 10.0)
+        else:
+            time_weight = 1.0
+        return max(recency * (1.0 + time_weight), 0.01)
+
+    @njit(cache=True, fastmath=True)
+    def fused_pick_index(recency, last_shown, now_ts, u):
+        """
+        Compute every post's weight (same formula as
+        DisplayViewer.calculate_weights) and pick an index in proportion to
+        it, given a uniform u in [0, 1). Compiled by numba into two passes
+        over the arrays with no intermediate weights or cumsum array: the
+        first sums the weights to scale u, the second recomputes them
+        while accumulating up to the target.
+        """
+        n = recency.shape[0]
+        total = 0.0
+        for i in range(n):
+            total += _fused_weight(recency[i], last_shown[i], now_ts)
+
+        target = u * total
+        cum = 0.0
+        for i in range(n):
+            cum += _fused_weight(recency[i], last_shown[i], now_ts)
+            if cum > target:
+                return i
+        return n - 1
+else:
+    fused_pick_index = None
 
 
 class DisplayViewer:
@@ -46,19 +249,57 @@ class DisplayViewer:
 
     def __init__(self):
         self.queue_file = Path(QUEUE_FILE)
+        self.queue_version_file = self.queue_file.with_suffix('.version')  # Bumped by feed_monitor
         self.posts = []  # All available posts
-        self.post_history = {}  # Track when each post was last shown: {post_id: timestamp}
-        self.skip_requested = False  # Flag to skip current post
+        self._queue_mtime = None  # st_mtime_ns of the queue file when last parsed
+        self._queue_hash = None  # Hash of the queue file contents when last parsed
+        self.skip_event = None  # Set when the skip button is clicked (created in run_in_browser())
+
+        # Per-post arrays aligned with self.posts, rebuilt by set_posts()
+        # (numpy arrays, or plain lists when numpy isn't installed)
+        self._id_to_idx = {}  # {post_id: index into self.posts}
+        self._post_ts = []  # date_modified of each post as a Unix timestamp (NaN if unparseable)
+        self._recency = []  # Recency weight of each post
+        self._last_shown = []  # Track when each post was last shown (0 = never shown)
+        self._discovered_at = []  # Discovery timestamp (0 = unknown)
+        self._keys = []  # Efraimidis-Spirakis sampling keys, log(u) / weight (numpy only)
+        self._last_key = 0.0  # Key of the most recently picked post
+        self._keys_refreshed_at = 0.0  # When all keys were last redrawn (0 = stale)
+        self._keys_stale = True  # Whether self._keys must be redrawn before they're read
+        self._weights = []  # Weights behind self._cum_weights (no numpy only)
+        self._cum_weights = []  # Cumulative weights for bisect selection (no numpy only)
+        self._cum_total = 0.0  # Last entry of self._cum_weights
+        self._dirty = True  # Whether the cumulative weights need a full rebuild
 
     def load_queue(self):
-        """Load posts from the queue file"""
+        """
+        Load posts from the queue file.
+
+        Returns self.posts unchanged without parsing the file if its
+        modification time or contents haven't changed since the last
+        successful parse. Callers can compare self._queue_hash to tell
+        whether the contents changed.
+        """
         try:
             if not self.queue_file.exists():
                 print(f"Queue file {self.queue_file} not found. Waiting for posts...")
                 return []
 
-            with open(self.queue_file, 'r') as f:
-                posts = json.load(f)
+            mtime = self.queue_file.stat().st_mtime_ns
+            if mtime == self._queue_mtime:
+                return self.posts
+
+            with open(self.queue_file, 'rb') as f:
+                raw = f.read()
+            queue_hash = self.hash_queue(raw)
+            if queue_hash == self._queue_hash:
+                self._queue_mtime = mtime
+                return self.posts
+
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            posts = [self.flatten_post(post) for post in data]
+            self._queue_mtime = mtime
+            self._queue_hash = queue_hash
 
             print(f"Loaded {len(posts)} posts from queue")
             return posts
@@ -69,22 +310,89 @@ class DisplayViewer:
             print(f"Error loading queue: {e}")
             return []
 
-    def save_queue(self, posts):
-        """Save the updated queue back to the file"""
+    def flatten_post(self, post):
+        """
+        Flatten a parsed queue entry into the attributes the viewer uses.
+
+        Nested lookups, defaults and date parsing happen once here, so the
+        rest of the viewer uses plain attribute access. The ID and author
+        name are interned so posts sharing them share one string object.
+        """
+        post_id = post.get("id")
+        author_name = (post.get("author") or {}).get("name", "Unknown")
+        return SimpleNamespace(
+            id=sys.intern(post_id) if isinstance(post_id, str) else post_id,
+            url=post.get("url"),
+            title=post.get("title", "Untitled"),
+            author_name=sys.intern(author_name) if isinstance(author_name, str) else author_name,
+            post_ts=self.parse_post_timestamp(post),
+            discovered_at=post.get("discovered_at", 0) or 0,
+            display_seconds=self.compute_display_seconds(post),
+        )
+
+    def read_queue_version(self):
+        """
+        Return the queue version counter that feed_monitor bumps after every
+        queue save, or None if it can't be read. Reading this tiny file is
+        much cheaper than reading the queue itself.
+        """
         try:
-            with open(self.queue_file, 'w') as f:
-                json.dump(posts, f, indent=2)
-        except Exception as e:
-            print(f"Error saving queue: {e}")
+            return int(self.queue_version_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def hash_queue(self, raw):
+        """Hash raw queue file bytes for change detection"""
+        if xxhash:
+            return xxhash.xxh3_64_intdigest(raw)
+        return hashlib.blake2b(raw, digest_size=8).digest()
+
+    def set_posts(self, posts):
+        """
+        Replace the current posts and precompute their selection data.
+
+        Takes posts flattened by load_queue, so get_next_post only does
+        arithmetic on the per-post arrays.
+        """
+        # Carry display history over to the new posts by ID
+        old_last_shown = self._last_shown
+        old_id_to_idx = self._id_to_idx
+
+        self.posts = posts
+        self._id_to_idx = {post.id: i for i, post in enumerate(posts) if post.id}
+        self._post_ts = self.to_array([post.post_ts for post in posts])
+        last_shown = [0.0] * len(posts)
+        for post_id, i in self._id_to_idx.items():
+            old_i = old_id_to_idx.get(post_id)
+            if old_i is not None:
+                last_shown[i] = old_last_shown[old_i]
+        self._last_shown = self.to_array(last_shown)
+        self._discovered_at = self.to_array([post.discovered_at for post in posts])
+        self.refresh_keys(time.time())
+
+    def to_array(self, values):
+        """Convert per-post values to a float64 array, or a list without numpy"""
+        if np is None:
+            return [float(value) for value in values]
+        return np.array(values, dtype=np.float64)
 
     def mark_post_as_displayed(self, post_id):
         """Mark a post as displayed by recording current timestamp"""
-        if post_id:
-            self.post_history[post_id] = time.time()
-
-    def calculate_time_for_post(self, post):
+        i = self._id_to_idx.get(post_id)
+        if i is not None:
+            now = time.time()
+            self._last_shown[i] = now
+            if np is None:
+                self.update_weight(i, now)
+            elif not self._keys_stale:
+                # Only this post's weight changed: redraw just its key
+                self.redraw_key(i, now)
+
+    def compute_display_seconds(self, post):
         """
         Calculate how long to spend on a post based on its characteristics.
+        Called once per queue entry when the queue is loaded, with the raw
+        entry (so it can look at e.g. content_html).
 
         Currently just returns TIME_PER_POST for all posts.
         In the future, this could be adjusted based on:
@@ -97,160 +405,246 @@ class DisplayViewer:
         """
         return TIME_PER_POST
 
-    def calculate_post_weight(self, post):
+    def calculate_time_for_post(self, post):
+        """Return how long to spend on a post, as computed when the queue was loaded"""
+        return post.display_seconds
+
+    def parse_post_timestamp(self, post):
         """
-        Calculate selection weight for a post based on:
-        1. Recency of post (newer = higher weight, exponential decay)
-        2. Time since last shown (longer ago = higher weight)
+        Return a post's date_modified as a Unix timestamp, or NaN on failure.
+        Uses the date_modified_ts precomputed by feed_monitor when present,
+        and only parses the date string for entries written without it.
+        """
+        date_modified_ts = post.get("date_modified_ts")
+        if isinstance(date_modified_ts, (int, float)):
+            return float(date_modified_ts)
+        date_modified = post.get("date_modified", "")
+        if not isinstance(date_modified, str):
+            return math.nan
+        return parse_iso_timestamp(date_modified)
+
+    def calculate_recency_weight(self, post_ts, now_ts):
+        """
+        Calculate the recency part of a post's selection weight
+        (newer = higher weight, staggered decay by age in days).
+
+        Takes the timestamp cached by parse_post_timestamp and a `now_ts`
+        computed once by the caller, so no parsing happens per post.
 
         No special priority for unseen posts - they'll naturally show up
         if they're recent. Brand new posts are handled separately by
         the feed monitor (added to front of queue).
+        The time-since-shown factor is combined with this in
+        calculate_weights. Recency weights are cached per post and only
+        recomputed by refresh_keys, when the posts change and every
+        10 minutes (KEY_REFRESH_INTERVAL in get_next_post).
         """
-        post_id = post.get("id")
+        if math.isnan(post_ts):
+            return UNKNOWN_DATE_RECENCY_WEIGHT
+
+        days_old = int((now_ts - post_ts) // 86400)
+        if 0 <= days_old < len(RECENCY_WEIGHTS):
+            return RECENCY_WEIGHTS[days_old]
+        return DEFAULT_RECENCY_WEIGHT
+
+    def calculate_recency_weights(self, now_ts):
+        """Recency weights of all posts, vectorized when numpy is available"""
+        if np is None:
+            return [self.calculate_recency_weight(post_ts, now_ts) for post_ts in self._post_ts]
+
+        days_old = np.floor_divide(now_ts - self._post_ts, 86400)
+        in_table = (days_old >= 0) & (days_old < len(RECENCY_WEIGHTS))  # False for NaN
+        table_index = np.where(in_table, days_old, len(RECENCY_WEIGHTS)).astype(np.intp)
+        recency = RECENCY_WEIGHTS_ARRAY[table_index]
+        recency[np.isnan(self._post_ts)] = UNKNOWN_DATE_RECENCY_WEIGHT
+        return recency
+
+    def calculate_weights(self, current_time, index=slice(None)):
+        """
+        Calculate selection weights from the precomputed per-post arrays:
+        1. Recency of post (precomputed in refresh_keys)
+        2. Time since last shown (longer ago = higher weight)
 
-        # Factor 1: Recency of post (staggered decay, not exponential)
-        # Weight for each day (day 0 = today, day 1 = yesterday, etc.)
-        RECENCY_WEIGHTS = {
-            0: 1.0,
-            1: 0.91,
-            2: 0.4,
-            3: 0.32,
-            4: 0.25,
-            5: 0.25,
-            6: 0.25,
-            7: 0.25,
-            8: 0.15,
-            9: 0.15,
-            10: 0.15,
-            11: 0.15,
-            12: 0.15,
-            13: 0.15,
-            14: 0.15,
-            15: 0.08,
-            16: 0.08,
-            17: 0.08,
-            18: 0.08,
-            19: 0.08,
-            20: 0.08,
-            21: 0.08,
-            22: 0.08,
-            23: 0.08,
-            24: 0.08,
-            25: 0.08,
-            26: 0.08,
-            27: 0.08,
-            28: 0.08,
-            29: 0.08,
-            30: 0.08,
-        }
-        DEFAULT_RECENCY_WEIGHT = 0.03  # For days > 30
+        Returns the weight vector, or a single weight if index is an int.
+        """
+        if np is None:
+            if isinstance(index, int):
+                return self.calculate_weight(self._recency[index], self._last_shown[index], current_time)
+            return [
+                self.calculate_weight(recency, last_shown, current_time)
+                for recency, last_shown in zip(self._recency[index], self._last_shown[index])
+            ]
+
+        last_shown = self._last_shown[index]
+        minutes_since_shown = (current_time - last_shown) / 60
+        # Posts shown recently get lower weight, caps at 10 after 10 hours.
+        # Never shown - just use recency weight
+        time_weight = np.where(last_shown > 0, np.minimum(minutes_since_shown / 60, 10.0), 1.0)
+
+        # Combine factors, with a minimum weight to keep all posts in pool
+        return np.maximum(self._recency[index] * (1 + time_weight), 0.01)
+
+    def calculate_weight(self, recency, last_shown, current_time):
+        """Scalar version of calculate_weights for the pure-Python fallback"""
+        if last_shown > 0:
+            time_weight = min((current_time - last_shown) / 60 / 60, 10.0)
+        else:
+            time_weight = 1.0
+        return max(recency * (1 + time_weight), 0.01)
 
-        try:
-            post_date_str = post.get("date_modified", "")
-            post_date = datetime.fromisoformat(post_date_str.replace('Z', '+00:00'))
-            days_old = (datetime.now(post_date.tzinfo) - post_date).days
+    def refresh_keys(self, current_time):
+        """
+        Recompute recency weights and redraw the sampling key of every
+        post from its current weight.
 
-            recency_weight = RECENCY_WEIGHTS.get(days_old, DEFAULT_RECENCY_WEIGHT)
-        except:
-            recency_weight = 0.1  # Default low weight if date parsing fails
+        Uses Efraimidis-Spirakis weighted sampling: each post gets the key
+        u ** (1 / weight) for uniform u, kept in log space as log(u) / weight,
+        and the post with the largest key is picked. Without numpy, the
+        cumulative weight table is marked for rebuilding instead.
 
-        # Factor 2: Time since last shown
-        last_shown = self.post_history.get(post_id, 0)
-        if last_shown > 0:
-            minutes_since_shown = (time.time() - last_shown) / 60
-            # Posts shown recently get lower weight
-            time_weight = min(minutes_since_shown / 60, 10)  # Caps at 10 after 10 hours
+        With numba, normal picks go through fused_pick_index and keys are
+        only read for recently discovered posts, so they are just marked
+        stale here and drawn when pick_index_with_keys next needs them.
+        """
+        self._recency = self.calculate_recency_weights(current_time)
+        self._keys_refreshed_at = current_time
+        if np is None:
+            self._dirty = True
+            return
+        if fused_pick_index is not None:
+            self._keys_stale = True
+            return
+        self.draw_keys(current_time)
+
+    def draw_keys(self, current_time):
+        """Draw a fresh sampling key for every post from its current weight (numpy path)"""
+        u = 1.0 - np.random.random_sample(len(self.posts))  # in (0, 1], avoids log(0)
+        self._keys = np.log(u) / self.calculate_weights(current_time)
+        self._last_key = 0.0
+        self._keys_stale = False
+
+    def redraw_key(self, index, current_time):
+        """Redraw one post's key, continuing from the most recently picked key"""
+        weight = self.calculate_weights(current_time, index)
+        self._keys[index] = self._last_key + np.log(1.0 - random.random()) / weight
+
+    def pick_index_with_keys(self, recently_discovered, current_time):
+        """Pick a post index by largest sampling key (numpy path)"""
+        if self._keys_stale:
+            self.draw_keys(current_time)
+
+        if recently_discovered:
+            mask = np.zeros(len(self.posts), dtype=bool)
+            mask[recently_discovered] = True
+            idx = int(np.argmax(np.where(mask, self._keys, -np.inf)))
+            # Keys outside the subset were skipped over, redraw them next pick
+            self._keys_refreshed_at = 0.0
         else:
-            # Never shown - just use recency weight
-            time_weight = 1.0
+            idx = int(np.argmax(self._keys))
 
-        # Combine factors
-        total_weight = recency_weight * (1 + time_weight)
-        return max(total_weight, 0.01)  # Minimum weight to keep all posts in pool
+        # Redraw the picked post's key so the next pick is an independent draw
+        self._last_key = self._keys[idx]
+        self.redraw_key(idx, current_time)
+        return idx
 
-    def get_next_post(self):
+    def pick_index_with_bisect(self, recently_discovered, current_time):
+        """
+        Pick a post index by binary search over cumulative weights
+        (pure-Python fallback). The table is only rebuilt when dirty.
+        """
+        if recently_discovered:
+            # Tiny table for the recently discovered subset only
+            weights = [self.calculate_weights(current_time, i) for i in recently_discovered]
+            cum = list(itertools.accumulate(weights))
+            return recently_discovered[bisect.bisect(cum, random.random() * cum[-1])]
+
+        if self._dirty:
+            self.rebuild_weights(current_time)
+        return bisect.bisect(self._cum_weights, random.random() * self._cum_total)
+
+    def rebuild_weights(self, current_time):
+        """Recompute all weights and the cumulative table (pure-Python fallback)"""
+        self._weights = self.calculate_weights(current_time)
+        self._cum_weights = list(itertools.accumulate(self._weights))
+        self._cum_total = self._cum_weights[-1] if self._cum_weights else 0.0
+        self._dirty = False
+
+    def update_weight(self, index, current_time):
+        """
+        Update one post's weight in the cumulative table (pure-Python fallback).
+        Only the suffix from index on changes, and it is re-accumulated
+        without recomputing any other post's weight.
+        """
+        if self._dirty:
+            return  # The next rebuild picks the change up anyway
+        self._weights[index] = self.calculate_weights(current_time, index)
+        start = self._cum_weights[index - 1] if index else 0.0
+        self._cum_weights[index:] = itertools.islice(
+            itertools.accumulate(self._weights[index:], initial=start), 1, None
+        )
+        self._cum_total = self._cum_weights[-1]
+
+    def get_next_post(self, now=None):
         """
         Select next post using weighted random selection.
 
         Priority system:
         1. If any posts were discovered in last 10 minutes, pick ONLY from those
         2. Otherwise, use normal weighted random selection
+
+        With numba, weights are recomputed and sampled exactly in compiled
+        code on every pick. Otherwise with numpy, keys are only redrawn for
+        the picked and the displayed post, which is an approximation: the
+        other keys keep the weights they were drawn with, while their
+        time-since-shown factor keeps growing. Pick frequencies drift a few
+        percent from exact weighted sampling (in simulation, a just-shown
+        post came up again about 4% less often), so all keys are redrawn
+        every few minutes and whenever the posts change.
+
+        `now` is the caller's wall-clock time.time() reading, shared by every
+        weight computed for this pick (read here if not given).
         """
-        if not self.posts:
+        num_posts = len(self.posts)
+        if num_posts == 0:
             return None
+        if num_posts == 1:
+            return self.posts[0]  # Nothing to choose between, skip all weight work
 
         # Check for recently discovered posts (within last 10 minutes)
         DISCOVERY_PRIORITY_WINDOW = 10 * 60  # 10 minutes in seconds
-        current_time = time.time()
+        KEY_REFRESH_INTERVAL = 10 * 60  # Redraw all keys at least this often
+        current_time = time.time() if now is None else now
 
-        recently_discovered = [
-            post for post in self.posts
-            if post.get('discovered_at', 0) > 0 and
-               (current_time - post.get('discovered_at', 0)) < DISCOVERY_PRIORITY_WINDOW
-        ]
+        if current_time - self._keys_refreshed_at >= KEY_REFRESH_INTERVAL:
+            self.refresh_keys(current_time)
 
         # If we have recently discovered posts, pick ONLY from those
+        if np is None:
+            recently_discovered = [
+                i for i, discovered_at in enumerate(self._discovered_at)
+                if discovered_at > 0 and current_time - discovered_at < DISCOVERY_PRIORITY_WINDOW
+            ]
+        else:
+            recently_discovered = np.flatnonzero(
+                (self._discovered_at > 0) & (current_time - self._discovered_at < DISCOVERY_PRIORITY_WINDOW)
+            ).tolist()
         if recently_discovered:
             print(f"🆕 Prioritizing {len(recently_discovered)} recently discovered post(s)")
-            posts_to_choose_from = recently_discovered
-        else:
-            posts_to_choose_from = self.posts
-
-        # Calculate weights for eligible posts
-        weights = [self.calculate_post_weight(post) for post in posts_to_choose_from]
 
-        # Weighted random selection
-        selected_post = random.choices(posts_to_choose_from, weights=weights, k=1)[0]
-
-        return selected_post
-
-    async def scroll_page(self, page: Page, duration: float):
-        """
-        Continuously scroll the page for a given duration.
-        Scrolls down slowly and returns to top when reaching bottom.
-        Checks for skip button clicks.
-        """
-        print(f"DEBUG: scroll_page called with duration={duration:.2f}s, SCROLL_SPEED={SCROLL_SPEED}, SCROLL_INTERVAL={SCROLL_INTERVAL}")
-        start_time = time.time()
-
-        while time.time() - start_time < duration:
-            # Check if skip button was clicked
-            try:
-                skip_clicked = await page.evaluate("""
-                    () => {
-                        const btn = document.getElementById('inkhaven-skip-btn');
-                        return btn && btn.getAttribute('data-skip-clicked') === 'true';
-                    }
-                """)
-                if skip_clicked:
-                    print("⏭️  Skip requested!")
-                    return  # Exit scrolling early
-            except:
-                pass  # Ignore errors checking button state
-
-            # Scroll down by SCROLL_SPEED pixels
-            await page.evaluate(f"window.scrollBy(0, {SCROLL_SPEED})")
-            await asyncio.sleep(SCROLL_INTERVAL)
-
-            # Check if we've reached the bottom
-            is_at_bottom = await page.evaluate("""
-                () => {
-                    return (window.innerHeight + window.scrollY) >= document.body.scrollHeight - 100;
-                }
-            """)
-
-            if is_at_bottom:
-                # Scroll back to top and continue
-                await page.evaluate("window.scrollTo(0, 0)")
-                await asyncio.sleep(0.5)
+        if np is None:
+            idx = self.pick_index_with_bisect(recently_discovered, current_time)
+        elif fused_pick_index is not None and not recently_discovered:
+            idx = int(fused_pick_index(self._recency, self._last_shown, current_time, random.random()))
+        else:
+            idx = self.pick_index_with_keys(recently_discovered, current_time)
+        return self.posts[idx]
 
     async def display_post(self, page: Page, post):
         """Navigate to and display a post"""
-        url = post.get("url")
-        title = post.get("title", "Untitled")
-        author = post.get("author", {}).get("name", "Unknown")
-        post_id = post.get("id")
+        url = post.url
+        title = post.title
+        author = post.author_name
+        post_id = post.id
 
         print(f"\n{'='*60}")
         print(f"Loading: {title}")
@@ -258,214 +652,176 @@ class DisplayViewer:
         print(f"URL: {url}")
         print(f"{'='*60}\n")
 
+        # A skip click on the previous post doesn't carry over to this one
+        if self.skip_event is not None:
+            self.skip_event.clear()
+
+        # Stop the previous page's scroll loop while the next one loads
+        try:
+            await page.evaluate(STOP_SCROLL_JS)
+        except Exception:
+            pass  # No page loaded yet
+
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT)
             await asyncio.sleep(PAGE_SETTLE_TIME)  # Let the page settle
 
-            # Apply zoom level
-            await page.evaluate(f"document.body.style.zoom = {ZOOM_LEVEL}")
-
-            # Add a skip button overlay
-            await self.add_skip_button(page)
-
             # Mark this post as displayed
             self.mark_post_as_displayed(post_id)
         except Exception as e:
             print(f"Error loading page: {e}")
 
-    async def add_skip_button(self, page: Page):
-        """Add a floating skip button to the page"""
-        try:
-            await page.evaluate("""
-                () => {
-                    // Remove any existing skip button
-                    const existing = document.getElementById('inkhaven-skip-btn');
-                    if (existing) existing.remove();
-
-                    // Create skip button
-                    const btn = document.createElement('button');
-                    btn.id = 'inkhaven-skip-btn';
-                    btn.innerHTML = '⏭';
-                    btn.style.cssText = `
-                        position: fixed;
-                        top: 30px;
-                        right: 30px;
-                        z-index: 999999;
-                        padding: 12px 16px;
-                        font-size: 20px;
-                        background: rgba(255, 255, 255, 0.85);
-                        color: #64748b;
-                        border: 1px solid rgba(226, 232, 240, 0.8);
-                        border-radius: 50px;
-                        cursor: pointer;
-                        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-                        backdrop-filter: blur(8px);
-                        transition: all 0.25s ease;
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-                        opacity: 0.6;
-                    `;
-
-                    btn.onmouseover = () => {
-                        btn.style.opacity = '1';
-                        btn.style.transform = 'translateY(-2px)';
-                        btn.style.boxShadow = '0 4px 12px rgba(0, 0, 0, 0.15)';
-                        btn.style.background = 'rgba(255, 255, 255, 0.95)';
-                        btn.style.color = '#475569';
-                    };
-                    btn.onmouseout = () => {
-                        btn.style.opacity = '0.6';
-                        btn.style.transform = 'translateY(0)';
-                        btn.style.boxShadow = '0 2px 8px rgba(0, 0, 0, 0.1)';
-                        btn.style.background = 'rgba(255, 255, 255, 0.85)';
-                        btn.style.color = '#64748b';
-                    };
-
-                    btn.onclick = () => {
-                        btn.setAttribute('data-skip-clicked', 'true');
-                        btn.innerHTML = '✓';
-                        btn.style.background = 'rgba(16, 185, 129, 0.9)';
-                        btn.style.color = 'white';
-                        btn.style.opacity = '1';
-                    };
-
-                    document.body.appendChild(btn);
-                }
-            """)
-        except Exception as e:
-            print(f"Error adding skip button: {e}")
+    async def install_overlay(self, context: BrowserContext):
+        """
+        Register the zoom level, skip button and in-browser scroll loop
+        (OVERLAY_JS) once on the browser context, so they apply automatically
+        to every page the viewer loads without any per-post calls into the
+        browser.
+        """
+        params = {
+            "speed": SCROLL_SPEED,
+            "interval": SCROLL_INTERVAL,
+            "settleMs": PAGE_SETTLE_TIME * 1000,
+            "zoom": ZOOM_LEVEL,
+        }
+        await context.add_init_script(script=f"({OVERLAY_JS})({json.dumps(params)})")
 
     async def run(self):
-        """Main run loop"""
+        """Main run loop, in a browser of its own"""
         async with async_playwright() as p:
-            # Launch browser with custom window size (half screen width)
-            print(f"Launching {BROWSER_TYPE} browser...")
-
-            # Select browser type
-            if BROWSER_TYPE == "chrome":
-                browser_engine = p.chromium
-                browser_args = [
-                    '--disable-blink-features=AutomationControlled',
-                    f'--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}',
-                    f'--window-position={WINDOW_POSITION_X},{WINDOW_POSITION_Y}'
-                ]
-            else:
-                browser_engine = p.chromium
-                browser_args = [
-                    f'--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}',
-                    f'--window-position={WINDOW_POSITION_X},{WINDOW_POSITION_Y}'
-                ]
-
-            browser = await browser_engine.launch(
-                headless=False,
-                channel="chrome" if BROWSER_TYPE == "chrome" else None,
-                args=browser_args
-            )
-
-            # Create page with no viewport restrictions (full width rendering)
-            # This allows the page to use the full window width
-            page = await browser.new_page(viewport=None, no_viewport=True)
-
-            # Load initial posts from queue
-            print("Loading posts from queue...")
-            self.posts = self.load_queue()
-
-            # Wait for posts if queue is empty
-            while not self.posts:
-                print("Waiting for posts to appear in queue...")
-                await asyncio.sleep(QUEUE_CHECK_INTERVAL)
-                self.posts = self.load_queue()
-
-            print(f"Starting display with {len(self.posts)} posts")
-
-            # Display the first post
-            current_post = self.get_next_post()
-            current_post_duration = 0
-            if current_post:
-                await self.display_post(page, current_post)
-                current_post_duration = self.calculate_time_for_post(current_post)
+            browser = await launch_browser(p)
+            try:
+                await self.run_in_browser(browser)
+            except KeyboardInterrupt:
+                print("\n\nShutting down...")
+            finally:
+                await browser.close()
 
-            last_queue_check = time.time()
-            last_post_change = time.time()
+    async def run_in_browser(self, browser: Browser):
+        """
+        Display posts in a new context of an already running browser, so the
+        viewer can share one browser process with fall25_viewer (see run_viewers.py).
+        """
+        # Create a context and page with no viewport restrictions (full width rendering)
+        # This allows the page to use the full window width
+        context = await browser.new_context(viewport=None, no_viewport=True)
+
+        # The skip button calls this binding directly, so nothing polls for clicks
+        self.skip_event = asyncio.Event()
+        await context.expose_binding("inkhavenSkip", lambda source: self.skip_event.set())
+
+        # Skip button and scrolling are set up by the page itself on every load
+        await self.install_overlay(context)
+
+        page = await context.new_page()
+
+        # Load initial posts from queue (off the event loop, file I/O blocks).
+        # The version is read first, so a save that lands while the queue is
+        # being read or the first post loads still triggers a reload later
+        print("Loading posts from queue...")
+        queue_version = self.read_queue_version()
+        self.set_posts(await asyncio.to_thread(self.load_queue))
+
+        # Wait for posts if queue is empty
+        while not self.posts:
+            print("Waiting for posts to appear in queue...")
+            await asyncio.sleep(QUEUE_CHECK_INTERVAL)
+            queue_version = self.read_queue_version()
+            self.set_posts(await asyncio.to_thread(self.load_queue))
+
+        print(f"Starting display with {len(self.posts)} posts")
+
+        # Display the first post
+        current_post = self.get_next_post()
+        current_post_duration = 0
+        if current_post:
+            await self.display_post(page, current_post)
+            current_post_duration = self.calculate_time_for_post(current_post)
+
+        last_post_change = time.monotonic()
+        # Queue checks run on a fixed grid so slow reloads don't push later checks back
+        next_queue_check = last_post_change + QUEUE_CHECK_INTERVAL
+
+        while True:
+            # Monotonic clock for intervals, unaffected by wall-clock adjustments;
+            # wall-clock time read once per iteration for post weights
+            current_time = time.monotonic()
+            now = time.time()
+
+            # Periodically check for queue updates
+            if current_time >= next_queue_check:
+                # Only reload when the monitor signalled a change
+                # (or when there's no version file to tell)
+                new_version = self.read_queue_version()
+                if new_version is None or new_version != queue_version:
+                    old_hash = self._queue_hash
+                    new_posts = await asyncio.to_thread(self.load_queue)
+                    if new_posts and self._queue_hash != old_hash:
+                        print(f"Queue updated: {len(new_posts)} posts available")
+                        self.set_posts(new_posts)
+                        # Reset index to start from beginning with new posts
+                        self.current_post_index = 0
+                    # Keep the old version if loading failed, so the next check tries again
+                    if new_posts:
+                        queue_version = new_version
+                while next_queue_check <= current_time:
+                    next_queue_check += QUEUE_CHECK_INTERVAL
+
+            # Switch posts after calculated duration, but enforce MAX_TIME_PER_POST
+            time_on_current_post = current_time - last_post_change
+            should_switch = (
+                time_on_current_post >= current_post_duration or
+                time_on_current_post >= MAX_TIME_PER_POST
+            )
 
-            try:
-                while True:
-                    current_time = time.time()
-
-                    # Periodically check for queue updates
-                    if current_time - last_queue_check >= QUEUE_CHECK_INTERVAL:
-                        new_posts = self.load_queue()
-                        if new_posts and len(new_posts) != len(self.posts):
-                            print(f"Queue updated: {len(new_posts)} posts available")
-                            self.posts = new_posts
-                            # Reset index to start from beginning with new posts
-                            self.current_post_index = 0
-                        last_queue_check = current_time
-
-                    # Switch posts after calculated duration, but enforce MAX_TIME_PER_POST
-                    time_on_current_post = current_time - last_post_change
-                    should_switch = (
-                        time_on_current_post >= current_post_duration or
-                        time_on_current_post >= MAX_TIME_PER_POST
-                    )
-
-                    if should_switch:
-                        # Get next post
-                        next_post = self.get_next_post()
+            if should_switch:
+                # Get next post
+                next_post = self.get_next_post(now)
+                if next_post:
+                    await self.display_post(page, next_post)
+                    current_post_duration = self.calculate_time_for_post(next_post)
+                    current_post = next_post
+                    last_post_change = current_time
+                else:
+                    # No posts available, reload queue
+                    print("No posts available. Reloading queue...")
+                    self.set_posts(await asyncio.to_thread(self.load_queue))
+                    if self.posts:
+                        next_post = self.get_next_post(now)
                         if next_post:
                             await self.display_post(page, next_post)
                             current_post_duration = self.calculate_time_for_post(next_post)
                             current_post = next_post
                             last_post_change = current_time
-                        else:
-                            # No posts available, reload queue
-                            print("No posts available. Reloading queue...")
-                            self.posts = self.load_queue()
-                            if self.posts:
-                                next_post = self.get_next_post()
-                                if next_post:
-                                    await self.display_post(page, next_post)
-                                    current_post_duration = self.calculate_time_for_post(next_post)
-                                    current_post = next_post
-                                    last_post_change = current_time
-                            else:
-                                # Still no posts, wait a bit
-                                await asyncio.sleep(QUEUE_CHECK_INTERVAL)
-                                continue
-
-                    # Check if skip button was clicked
-                    try:
-                        skip_clicked = await page.evaluate("""
-                            () => {
-                                const btn = document.getElementById('inkhaven-skip-btn');
-                                return btn && btn.getAttribute('data-skip-clicked') === 'true';
-                            }
-                        """)
-                        if skip_clicked:
-                            print("⏭️  Skip button clicked! Moving to next post...")
-                            # Get next post
-                            next_post = self.get_next_post()
-                            if next_post:
-                                await self.display_post(page, next_post)
-                                current_post_duration = self.calculate_time_for_post(next_post)
-                                current_post = next_post
-                                last_post_change = current_time
-                            continue
-                    except:
-                        pass  # Ignore errors checking button state
-
-                    # Continuously scroll for a short duration
-                    time_elapsed = current_time - last_post_change
-                    scroll_duration = min(1.0, current_post_duration - time_elapsed)
-                    print(f"DEBUG: current_post_duration={current_post_duration}, time_elapsed={time_elapsed:.1f}, scroll_duration={scroll_duration:.1f}")
-                    if scroll_duration > 0:
-                        await self.scroll_page(page, scroll_duration)
-
-                    await asyncio.sleep(0.1)
-
-            except KeyboardInterrupt:
-                print("\n\nShutting down...")
-            finally:
-                await browser.close()
+                    else:
+                        # Still no posts, wait a bit
+                        await asyncio.sleep(QUEUE_CHECK_INTERVAL)
+                        continue
+
+            # Check if skip button was clicked (set by the inkhavenSkip binding)
+            if self.skip_event.is_set():
+                print("⏭️  Skip button clicked! Moving to next post...")
+                # Get next post
+                next_post = self.get_next_post(now)
+                if next_post:
+                    await self.display_post(page, next_post)
+                    current_post_duration = self.calculate_time_for_post(next_post)
+                    current_post = next_post
+                    last_post_change = current_time
+                else:
+                    self.skip_event.clear()
+                continue
+
+            # Sleep until the next post switch or queue check is due, or
+            # until the skip button is clicked, whichever comes first
+            next_due = min(
+                last_post_change + min(current_post_duration, MAX_TIME_PER_POST),
+                next_queue_check,
+            )
+            try:
+                await asyncio.wait_for(self.skip_event.wait(), max(next_due - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                pass
 
 
 if __name__ == "__main__":
@@ -6,25 +6,102 @@ Opens the Fall 25 page and auto-refreshes every 30 seconds
 
 import asyncio
 import sys
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, Browser
 
 # Force unbuffered output
 sys.stdout.reconfigure(line_buffering=True)
 sys.stderr.reconfigure(line_buffering=True)
 
-from config import (
-    WINDOW_WIDTH,
-    WINDOW_HEIGHT,
-    WINDOW_POSITION_X,
-    WINDOW_POSITION_Y,
-    PAGE_LOAD_TIMEOUT,
-    BROWSER_TYPE,
-)
+from config import PAGE_LOAD_TIMEOUT
+from launcher import launch_browser
 
 FALL25_URL = "https://www.inkhaven.blog/fall-25"
-REFRESH_INTERVAL = 30  # seconds
+REFRESH_INTERVAL = 30  # seconds, in-page content refresh
+RELOAD_INTERVAL = 600  # seconds, full page reload as a safety net
 ZOOM_LEVEL = 0.67  # 67% zoom (zoom out)
 
+# Registered with add_init_script so every load (and reload) of the page gets
+# the zoom level without a separate page.evaluate call. Called with the zoom.
+SET_ZOOM_JS = """
+(zoom) => {
+    // Only the top-level document is zoomed, not iframes
+    if (window.top !== window) return;
+
+    const apply = () => { document.body.style.zoom = zoom; };
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', apply);
+    } else {
+        apply();
+    }
+}
+"""
+
+# Registered with add_init_script. Every interval ms, fetches the page again
+# and swaps the new <main> (or <body> contents) into the live document,
+# instead of navigating. The DOM is only touched when the fetched HTML
+# changed: the first fetch, made right after the page loads, only records
+# the baseline. Called with the interval.
+REFRESH_CONTENT_JS = """
+(interval) => {
+    if (window.top !== window) return;
+    let lastHtml = null;
+    const refresh = async () => {
+        try {
+            const response = await fetch(location.href, { cache: 'no-store' });
+            if (!response.ok) return;
+            const html = await response.text();
+            if (lastHtml === null) {
+                lastHtml = html;  // Baseline for the freshly loaded page, nothing to patch
+                return;
+            }
+            if (html === lastHtml) return;
+            lastHtml = html;
+            const doc = new DOMParser().parseFromString(html, 'text/html');
+            const selector = document.querySelector('main') && doc.querySelector('main') ? 'main' : 'body';
+            document.querySelector(selector).innerHTML = doc.querySelector(selector).innerHTML;
+        } catch (e) {
+            // Try again next interval, the full reload from Python catches anything worse
+        }
+    };
+    refresh();
+    setInterval(refresh, interval);
+}
+"""
+
+async def refresh_loop(browser: Browser):
+    """
+    Show the Fall 25 page in a new context of an already running browser.
+    The page refreshes its own content every REFRESH_INTERVAL seconds
+    (REFRESH_CONTENT_JS); this loop only does a full reload every
+    RELOAD_INTERVAL seconds, or after REFRESH_INTERVAL if loading failed.
+    Used by run() and by run_viewers.py, which shares one browser with the
+    display viewer.
+    """
+    # Create page with no viewport restrictions
+    context = await browser.new_context(viewport=None, no_viewport=True)
+    page = await context.new_page()
+    await page.add_init_script(script=f"({SET_ZOOM_JS})({ZOOM_LEVEL})")
+    await page.add_init_script(script=f"({REFRESH_CONTENT_JS})({REFRESH_INTERVAL * 1000})")
+
+    load_count = 0
+    while True:
+        load_count += 1
+        print(f"[Load #{load_count}] Loading {FALL25_URL}...")
+
+        try:
+            # Zoom and in-page refresh are set up by the init scripts as the page loads
+            await page.goto(FALL25_URL, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT)
+            print(f"✅ Page loaded successfully (zoom: {int(ZOOM_LEVEL * 100)}%)")
+            wait = RELOAD_INTERVAL
+        except Exception as e:
+            print(f"❌ Error loading page: {e}")
+            wait = REFRESH_INTERVAL
+
+        # Wait for next full reload
+        print(f"⏱️  Waiting {wait}s until next full reload...")
+        print()
+        await asyncio.sleep(wait)
+
 
 async def run():
     """Main run loop"""
@@ -33,55 +110,14 @@ async def run():
         print("Inkhaven Fall 25 Viewer")
         print("=" * 60)
         print(f"URL: {FALL25_URL}")
-        print(f"Refresh interval: {REFRESH_INTERVAL}s")
-        print(f"Launching {BROWSER_TYPE} browser...")
+        print(f"Refresh interval: {REFRESH_INTERVAL}s (full reload every {RELOAD_INTERVAL}s)")
         print("=" * 60)
         print()
 
-        # Select browser type
-        if BROWSER_TYPE == "chrome":
-            browser_engine = p.chromium
-            browser_args = [
-                '--disable-blink-features=AutomationControlled',
-                f'--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}',
-                f'--window-position={WINDOW_POSITION_X},{WINDOW_POSITION_Y}'
-            ]
-        else:
-            browser_engine = p.chromium
-            browser_args = [
-                f'--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}',
-                f'--window-position={WINDOW_POSITION_X},{WINDOW_POSITION_Y}'
-            ]
-
-        browser = await browser_engine.launch(
-            headless=False,
-            channel="chrome" if BROWSER_TYPE == "chrome" else None,
-            args=browser_args
-        )
-
-        # Create page with no viewport restrictions
-        page = await browser.new_page(viewport=None, no_viewport=True)
+        browser = await launch_browser(p)
 
         try:
-            refresh_count = 0
-            while True:
-                refresh_count += 1
-                print(f"[Refresh #{refresh_count}] Loading {FALL25_URL}...")
-
-                try:
-                    await page.goto(FALL25_URL, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT)
-
-                    # Apply zoom level
-                    await page.evaluate(f"document.body.style.zoom = {ZOOM_LEVEL}")
-                    print(f"✅ Page loaded successfully (zoom: {int(ZOOM_LEVEL * 100)}%)")
-                except Exception as e:
-                    print(f"❌ Error loading page: {e}")
-
-                # Wait for next refresh
-                print(f"⏱️  Waiting {REFRESH_INTERVAL}s until next refresh...")
-                print()
-                await asyncio.sleep(REFRESH_INTERVAL)
-
+            await refresh_loop(browser)
         except KeyboardInterrupt:
             print("\n\n⏹️  Viewer stopped by user")
         finally:
@@ -8,39 +8,100 @@ and maintains a queue of new posts for consumption by other processes.
 
 Files created/managed:
 - post_queue.json: Queue of new posts waiting to be displayed
+- post_queue.version: Counter bumped after every queue save so readers can detect changes cheaply
 - seen_posts.json: Record of all post IDs that have been encountered
 """
 
 import asyncio
+import importlib.util
 import json
+import os
 import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Set
 
 import httpx
 from config import FEED_URL, FEED_CHECK_INTERVAL, QUEUE_FILE, SEEN_POSTS_FILE
 
+try:
+    import orjson  # Optional faster JSON (de)serialization
+except ImportError:
+    orjson = None
+
 
 # Use config values
 CHECK_INTERVAL = FEED_CHECK_INTERVAL
 QUEUE_FILE = Path(QUEUE_FILE)
+QUEUE_VERSION_FILE = QUEUE_FILE.with_suffix('.version')
 SEEN_POSTS_FILE = Path(SEEN_POSTS_FILE)
 
+# Returned by fetch_feed when the server says the feed hasn't changed (HTTP 304)
+FEED_NOT_MODIFIED = object()
+
+
+def load_json(raw: bytes):
+    """Parse JSON bytes, with orjson when available"""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write data to a temporary file next to path, then rename it over path"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def date_modified_timestamp(item: Dict) -> float | None:
+    """Parse an item's ISO 8601 date_modified into a Unix timestamp, or None if missing or invalid"""
+    date_modified = item.get('date_modified')
+    if not isinstance(date_modified, str):
+        return None
+    try:
+        return datetime.fromisoformat(date_modified.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def dump_json(obj) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when available"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
 
 class FeedMonitor:
     """Monitors the Inkhaven feed and manages the post queue."""
 
     def __init__(self):
         self.seen_posts: Set[str] = self._load_seen_posts()
-        self.queue: List[Dict] = self._load_queue()
+        self.queue: OrderedDict[str, Dict] = self._load_queue()
+        self.queue_version: int = self._load_queue_version()
+
+        # Set when the in-memory queue / seen posts differ from the files on
+        # disk, cleared only once a save succeeds, so failed saves are retried
+        self.queue_dirty = False
+        self.seen_posts_dirty = False
+
+        # One long-lived client so connections (and TLS sessions) are reused between checks.
+        # HTTP/2 needs the optional h2 package (httpx[http2]).
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+        # Validators from the last successful download, for conditional requests
+        self.etag: str | None = None
+        self.last_modified: str | None = None
 
     def _load_seen_posts(self) -> Set[str]:
         """Load the set of previously seen post IDs from disk."""
         if SEEN_POSTS_FILE.exists():
             try:
-                with open(SEEN_POSTS_FILE, 'r') as f:
-                    data = json.load(f)
+                with open(SEEN_POSTS_FILE, 'rb') as f:
+                    data = load_json(f.read())
                     print(f"📋 Loaded {len(data)} seen posts from {SEEN_POSTS_FILE}")
                     return set(data)
             except (json.JSONDecodeError, IOError) as e:
@@ -50,49 +111,91 @@ class FeedMonitor:
             print(f"📄 No seen posts file found, starting fresh")
             return set()
 
-    def _save_seen_posts(self):
-        """Save the set of seen post IDs to disk."""
+    def _save_seen_posts(self) -> bool:
+        """
+        Save the set of seen post IDs to disk. Returns whether it succeeded.
+
+        Written in set iteration order; the file is only ever read back into a set.
+        """
         try:
-            with open(SEEN_POSTS_FILE, 'w') as f:
-                json.dump(sorted(list(self.seen_posts)), f, indent=2)
+            write_atomic(SEEN_POSTS_FILE, dump_json(list(self.seen_posts)))
+            return True
         except IOError as e:
             print(f"❌ Error saving seen posts: {e}")
+            return False
 
-    def _load_queue(self) -> List[Dict]:
-        """Load the post queue from disk."""
+    def _load_queue(self) -> OrderedDict[str, Dict]:
+        """Load the post queue from disk, keyed by post ID in queue order."""
         if QUEUE_FILE.exists():
             try:
-                with open(QUEUE_FILE, 'r') as f:
-                    queue = json.load(f)
+                with open(QUEUE_FILE, 'rb') as f:
+                    queue = load_json(f.read())
                     print(f"📥 Loaded {len(queue)} posts from queue")
-                    return queue
+                    return OrderedDict((post['id'], post) for post in queue if post.get('id'))
             except (json.JSONDecodeError, IOError) as e:
                 print(f"⚠️  Error loading queue: {e}")
-                return []
+                return OrderedDict()
         else:
             print(f"📄 No queue file found, starting with empty queue")
-            return []
+            return OrderedDict()
 
-    def _save_queue(self):
-        """Save the post queue to disk."""
+    def _load_queue_version(self) -> int:
+        """Load the last queue version, so it keeps increasing across restarts."""
         try:
-            with open(QUEUE_FILE, 'w') as f:
-                json.dump(self.queue, f, indent=2)
+            return int(QUEUE_VERSION_FILE.read_bytes())
+        except (ValueError, IOError):
+            return 0
+
+    def _save_queue(self) -> bool:
+        """
+        Save the post queue to disk. Returns whether it succeeded.
+
+        The queue is replaced atomically so the display viewer never reads a
+        half-written file, then the version counter is bumped to tell the
+        viewer there is something new to read.
+        """
+        try:
+            write_atomic(QUEUE_FILE, dump_json(list(self.queue.values())))
+            self.queue_version += 1
+            write_atomic(QUEUE_VERSION_FILE, str(self.queue_version).encode())
+            return True
         except IOError as e:
             print(f"❌ Error saving queue: {e}")
+            return False
+
+    def save_pending(self):
+        """Save the queue and seen posts if they changed since the last successful save."""
+        if self.queue_dirty:
+            self.queue_dirty = not self._save_queue()
+        if self.seen_posts_dirty:
+            self.seen_posts_dirty = not self._save_seen_posts()
 
-    async def fetch_feed(self) -> Dict | None:
+    async def fetch_feed(self) -> Dict | object | None:
         """
         Download the feed from the Inkhaven blog.
 
+        Sends If-None-Match / If-Modified-Since from the previous download,
+        so an unchanged feed costs a 304 response with no body.
+
         Returns:
-            The parsed JSON feed, or None if there was an error.
+            The parsed JSON feed, FEED_NOT_MODIFIED if the feed hasn't changed
+            since the last download, or None if there was an error.
         """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(FEED_URL)
-                response.raise_for_status()
-                return response.json()
+            response = await self.client.get(FEED_URL, headers=headers)
+            if response.status_code == 304:
+                return FEED_NOT_MODIFIED
+            response.raise_for_status()
+            feed = response.json()
+            self.etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
+            return feed
         except httpx.HTTPError as e:
             print(f"❌ HTTP error fetching feed: {e}")
             return None
@@ -117,31 +220,52 @@ class FeedMonitor:
 
         items = feed['items']
         new_posts = []
-        existing_posts = []
+        changed = False
+        feed_ids = set()
+        now = time.time()
 
-        # Separate new posts from existing ones
         for item in items:
             post_id = item.get('id')
             if not post_id:
                 continue
+            feed_ids.add(post_id)
+
+            # Precomputed so the display viewer doesn't have to parse the date string
+            date_modified_ts = date_modified_timestamp(item)
+            if date_modified_ts is not None:
+                item['date_modified_ts'] = date_modified_ts
 
             # If this is a brand new post we haven't seen before
             if post_id not in self.seen_posts:
                 # Mark when this post was discovered
-                item['discovered_at'] = time.time()
+                item['discovered_at'] = now
                 new_posts.append(item)
                 self.seen_posts.add(post_id)
             else:
-                existing_posts.append(item)
-
-        # Build queue: new posts first, then existing posts
-        # This ensures brand new posts get shown immediately
-        self.queue = new_posts + existing_posts
-
-        # Save updated queue and seen posts
-        self._save_queue()
+                # Keep the discovery time from earlier checks, the fresh feed item doesn't have it
+                previous = self.queue.get(post_id)
+                if previous is not None and 'discovered_at' in previous:
+                    item['discovered_at'] = previous['discovered_at']
+
+            if self.queue.get(post_id) != item:
+                self.queue[post_id] = item
+                changed = True
+
+        # Drop posts that have fallen out of the feed
+        for post_id in [pid for pid in self.queue if pid not in feed_ids]:
+            del self.queue[post_id]
+            changed = True
+
+        # New posts go to the front of the queue so they get shown immediately
+        for post in reversed(new_posts):
+            self.queue.move_to_end(post['id'], last=False)
+
+        # Only rewrite the files when something changed (or an earlier save failed)
+        if changed:
+            self.queue_dirty = True
         if new_posts:
-            self._save_seen_posts()
+            self.seen_posts_dirty = True
+        self.save_pending()
 
         # Report findings
         if new_posts:
@@ -165,6 +289,11 @@ class FeedMonitor:
         print("=" * 60)
         print()
 
+        # Checks run on a fixed grid (start + k * interval) so slow fetches don't push the schedule back
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tick = 0
+
         iteration = 0
         while True:
             iteration += 1
@@ -172,19 +301,27 @@ class FeedMonitor:
             print(f"[{timestamp}] Check #{iteration}: Fetching feed...")
 
             feed = await self.fetch_feed()
-            if feed:
+            if feed is FEED_NOT_MODIFIED:
+                print("✅ Feed unchanged since last check")
+            elif feed:
                 print(f"✅ Feed downloaded successfully ({len(feed.get('items', []))} total posts)")
-                self.process_feed(feed)
+                # Queue and seen-posts writes are blocking file I/O, keep them off the event loop
+                await asyncio.to_thread(self.process_feed, feed)
             else:
                 print("⚠️  Failed to fetch feed, will retry next interval")
 
+            # Retry saves that failed earlier even when there was nothing new to process
+            if self.queue_dirty or self.seen_posts_dirty:
+                await asyncio.to_thread(self.save_pending)
+
             # Show current queue status
             print(f"📊 Queue status: {len(self.queue)} post(s) waiting")
             print(f"📚 Total posts seen: {len(self.seen_posts)}")
             print()
 
-            # Wait for next check
-            await asyncio.sleep(CHECK_INTERVAL)
+            # Wait for next check, skipping any ticks that were missed while this one ran long
+            tick = max(tick + 1, int((loop.time() - start) // CHECK_INTERVAL) + 1)
+            await asyncio.sleep(max(0, start + tick * CHECK_INTERVAL - loop.time()))
 
 
 async def main():
@@ -196,6 +333,8 @@ async def main():
         print("\n\n⏹️  Monitor stopped by user")
         print(f"Final status: {len(monitor.queue)} posts in queue, {len(monitor.seen_posts)} posts seen")
         sys.exit(0)
+    finally:
+        await monitor.client.aclose()
 
 
 if __name__ == "__main__":
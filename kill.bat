@@ -1,6 +1,7 @@
 @echo off
 REM Inkhaven Feed Viewer - Kill Script
-REM Stops the feed monitor, display viewer, and fall25 viewer
+REM Stops the feed monitor and the combined viewers process (run_viewers: display
+REM viewer + fall25 viewer), plus any viewer started on its own
 
 echo ==========================================
 echo Stopping Inkhaven Feed Viewer
@@ -30,7 +31,7 @@ for /f "tokens=2" %%a in ('wmic process where "commandline like '%%feed_monitor.
     set /a KILLED+=1
 )
 
-REM Kill display viewer by PID file
+REM Kill viewers (run_viewers, or display viewer started on its own) by PID file
 if exist .viewer.pid (
     set /p VIEWER_PID=<.viewer.pid
     echo Checking for display viewer with PID: !VIEWER_PID!...
@@ -51,22 +52,17 @@ for /f "tokens=2" %%a in ('wmic process where "commandline like '%%display_viewe
     set /a KILLED+=1
 )
 
-REM Kill fall25 viewer by PID file
-if exist .fall25.pid (
-    set /p FALL25_PID=<.fall25.pid
-    echo Checking for Fall 25 viewer with PID: !FALL25_PID!...
-    tasklist /FI "PID eq !FALL25_PID!" 2>NUL | find /I "python.exe">NUL
-    if "!ERRORLEVEL!"=="0" (
-        echo Stopping Fall 25 viewer (PID: !FALL25_PID!)...
-        taskkill /PID !FALL25_PID! /F >NUL 2>&1
-        set /a KILLED+=1
-    )
-    del .fall25.pid
+REM Kill any remaining run_viewers processes
+for /f "tokens=2" %%a in ('wmic process where "commandline like '%%run_viewers%%'" get processid 2^>NUL ^| findstr /r "[0-9]"') do (
+    echo Found additional viewers process: %%a
+    echo    Killing...
+    taskkill /PID %%a /F >NUL 2>&1
+    set /a KILLED+=1
 )
 
-REM Kill any remaining fall25_viewer.py processes
+REM Kill fall25 viewer started on its own
 for /f "tokens=2" %%a in ('wmic process where "commandline like '%%fall25_viewer.py%%'" get processid 2^>NUL ^| findstr /r "[0-9]"') do (
-    echo Found additional Fall 25 viewer process: %%a
+    echo Found Fall 25 viewer process: %%a
     echo    Killing...
     taskkill /PID %%a /F >NUL 2>&1
     set /a KILLED+=1
@@ -1,7 +1,8 @@
 #!/bin/bash
 
 # Inkhaven Feed Viewer - Kill Script
-# Stops the feed monitor, display viewer, and fall25 viewer
+# Stops the feed monitor and the combined viewers process (run_viewers: display
+# viewer + fall25 viewer), plus any viewer started on its own
 
 echo "=========================================="
 echo "Stopping Inkhaven Feed Viewer"
@@ -30,7 +31,7 @@ if [ ! -z "$MONITOR_PIDS" ]; then
     KILLED=$((KILLED + 1))
 fi
 
-# Kill display viewer
+# Kill viewers (run_viewers, or display viewer started on its own)
 if [ -f .viewer.pid ]; then
     VIEWER_PID=$(cat .viewer.pid)
     if ps -p $VIEWER_PID > /dev/null 2>&1; then
@@ -50,21 +51,19 @@ if [ ! -z "$VIEWER_PIDS" ]; then
     KILLED=$((KILLED + 1))
 fi
 
-# Kill fall25 viewer
-if [ -f .fall25.pid ]; then
-    FALL25_PID=$(cat .fall25.pid)
-    if ps -p $FALL25_PID > /dev/null 2>&1; then
-        echo "📅 Stopping Fall 25 viewer (PID: $FALL25_PID)..."
-        kill $FALL25_PID
-        KILLED=$((KILLED + 1))
-    fi
-    rm .fall25.pid
+# Kill combined viewers process started by run.sh
+VIEWERS_PIDS=$(pgrep -f "run_viewers")
+if [ ! -z "$VIEWERS_PIDS" ]; then
+    echo "🖥️  Found viewers processes: $VIEWERS_PIDS"
+    echo "   Killing..."
+    pkill -f "run_viewers"
+    KILLED=$((KILLED + 1))
 fi
 
-# Also kill by process name in case PID file is missing
+# Kill fall25 viewer started on its own
 FALL25_PIDS=$(pgrep -f "fall25_viewer.py")
 if [ ! -z "$FALL25_PIDS" ]; then
-    echo "📅 Found additional Fall 25 viewer processes: $FALL25_PIDS"
+    echo "📅 Found Fall 25 viewer processes: $FALL25_PIDS"
     echo "   Killing..."
     pkill -f "fall25_viewer.py"
     KILLED=$((KILLED + 1))
@@ -0,0 +1,41 @@
+"""
+Browser launching shared by display_viewer.py, fall25_viewer.py and run_viewers.py.
+Kept free of the viewers' own dependencies so importing it stays cheap.
+"""
+
+from playwright.async_api import Browser
+
+from config import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    WINDOW_POSITION_X,
+    WINDOW_POSITION_Y,
+    BROWSER_TYPE,
+)
+
+
+async def launch_browser(p) -> Browser:
+    """Launch the configured browser with custom window size (half screen width)"""
+    print(f"Launching {BROWSER_TYPE} browser...")
+
+    # Select browser type
+    if BROWSER_TYPE == "chrome":
+        browser_engine = p.chromium
+        browser_args = [
+            '--disable-blink-features=AutomationControlled',
+            f'--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}',
+            f'--window-position={WINDOW_POSITION_X},{WINDOW_POSITION_Y}'
+        ]
+    else:
+        browser_engine = p.chromium
+        browser_args = [
+            f'--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}',
+            f'--window-position={WINDOW_POSITION_X},{WINDOW_POSITION_Y}'
+        ]
+
+    return await browser_engine.launch(
+        headless=False,
+        channel="chrome" if BROWSER_TYPE == "chrome" else None,
+        args=browser_args
+    )
+
@@ -31,17 +31,6 @@ if exist .viewer.pid (
     del .viewer.pid
 )
 
-if exist .fall25.pid (
-    set /p FALL25_PID=<.fall25.pid
-    tasklist /FI "PID eq !FALL25_PID!" 2>NUL | find "!FALL25_PID!" >NUL
-    if not errorlevel 1 (
-        echo WARNING: Fall 25 viewer is already running ^(PID: !FALL25_PID!^)
-        echo    Run kill.bat first to stop existing processes
-        exit /b 1
-    )
-    del .fall25.pid
-)
-
 REM Start feed monitor in background
 echo Starting feed monitor...
 start "InkhavenFeedMonitor" /B cmd /c "uv run -m feed_monitor > feed_monitor.log 2>&1"
@@ -59,39 +48,25 @@ REM Wait for monitor to initialize
 echo Waiting for feed monitor to initialize...
 timeout /t 2 /nobreak >NUL
 
-REM Start display viewer in background
-echo Starting display viewer...
-start "InkhavenDisplayViewer" /B cmd /c "uv run -m display_viewer > display_viewer.log 2>&1"
+REM Start display viewer and fall25 viewer in background, sharing one browser
+echo Starting display viewer and Fall 25 viewer...
+start "InkhavenViewers" /B cmd /c "uv run -m run_viewers > display_viewer.log 2>&1"
 timeout /t 1 /nobreak >NUL
 
-REM Get PID of display viewer
-for /f "tokens=2" %%a in ('wmic process where "commandline like '%%display_viewer.py%%'" get processid ^| findstr /r "[0-9]"') do (
-    echo    Display viewer started (PID: %%a)
+REM Get PID of viewers
+for /f "tokens=2" %%a in ('wmic process where "commandline like '%%run_viewers%%'" get processid ^| findstr /r "[0-9]"') do (
+    echo    Viewers started (PID: %%a)
     echo %%a > .viewer.pid
 )
 echo    Logs: display_viewer.log
 echo.
 
-REM Start fall25 viewer in background
-echo Starting Fall 25 viewer...
-start "InkhavenFall25Viewer" /B cmd /c "uv run -m fall25_viewer > fall25_viewer.log 2>&1"
-timeout /t 1 /nobreak >NUL
-
-REM Get PID of fall25 viewer
-for /f "tokens=2" %%a in ('wmic process where "commandline like '%%fall25_viewer.py%%'" get processid ^| findstr /r "[0-9]"') do (
-    echo    Fall 25 viewer started (PID: %%a)
-    echo %%a > .fall25.pid
-)
-echo    Logs: fall25_viewer.log
-echo.
-
 echo ==========================================
 echo Inkhaven Feed Viewer is running!
 echo ==========================================
 echo.
 echo Monitor logs:  type feed_monitor.log
 echo Viewer logs:   type display_viewer.log
-echo Fall 25 logs:  type fall25_viewer.log
 echo.
 echo To view logs continuously: powershell Get-Content feed_monitor.log -Wait
 echo To stop: kill.bat
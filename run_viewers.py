@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Inkhaven Viewers
+Runs the display viewer and the Fall 25 viewer in one browser, each in its own
+context, instead of launching a separate browser process for each.
+Feed monitoring is still handled separately by feed_monitor.py.
+"""
+
+import asyncio
+from playwright.async_api import async_playwright
+
+from display_viewer import DisplayViewer
+from launcher import launch_browser
+from fall25_viewer import refresh_loop
+
+
+async def run():
+    """Main run loop"""
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            await asyncio.gather(
+                DisplayViewer().run_in_browser(browser),
+                refresh_loop(browser),
+            )
+        except KeyboardInterrupt:
+            print("\n\nShutting down...")
+        finally:
+            await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())